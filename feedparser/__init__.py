@@ -25,7 +25,7 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE."""
 
-from .api import parse
+from .api import parse, parse_many
 from .datetimes import registerDateHandler
 from .exceptions import (
     CharacterEncodingOverride,
@@ -61,6 +61,7 @@ OPTIMISTIC_ENCODING_DETECTION = 1
 
 __all__ = (
     "parse",
+    "parse_many",
     "registerDateHandler",
     "FeedParserDict",
     "FeedparserError",
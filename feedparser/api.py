@@ -26,11 +26,15 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import concurrent.futures
+import functools
 import io
+import threading
+import types
 import urllib.error
-import urllib.parse
 import xml.sax
-from typing import IO, Optional, Union
+from collections.abc import Iterable
+from typing import IO, Any, Optional, Union
 
 from . import http
 from .encodings import MissingEncoding, convert_file_to_utf8
@@ -43,32 +47,48 @@ from .sanitizer import replace_doctype
 from .urls import make_safe_absolute_uri
 from .util import FeedParserDict
 
-# List of preferred XML parsers, by SAX driver name.  These will be tried first,
-# but if they're not installed, Python will keep searching through its own list
+# Preferred SAX drivers, by name, for the xml.sax strict parser.
+# If they're not installed, Python will keep searching through its own list
 # of pre-installed parsers until it finds one that supports everything we need.
-PREFERRED_XML_PARSERS = ["drv_libxml2"]
+#
+# This is only read the first time a strict parser is created,
+# because _make_sax_parser() caches the driver that was found;
+# replace it before parsing any feeds for it to take effect.
+PREFERRED_XML_PARSERS = ("drv_libxml2",)
 
 _XML_AVAILABLE = True
 
-SUPPORTED_VERSIONS = {
-    "": "unknown",
-    "rss090": "RSS 0.90",
-    "rss091n": "RSS 0.91 (Netscape)",
-    "rss091u": "RSS 0.91 (Userland)",
-    "rss092": "RSS 0.92",
-    "rss093": "RSS 0.93",
-    "rss094": "RSS 0.94",
-    "rss20": "RSS 2.0",
-    "rss10": "RSS 1.0",
-    "rss": "RSS (unknown version)",
-    "atom01": "Atom 0.1",
-    "atom02": "Atom 0.2",
-    "atom03": "Atom 0.3",
-    "atom10": "Atom 1.0",
-    "atom": "Atom (unknown version)",
-    "cdf": "CDF",
-    "json1": "JSON feed 1",
-}
+SUPPORTED_VERSIONS = types.MappingProxyType(
+    {
+        "": "unknown",
+        "rss090": "RSS 0.90",
+        "rss091n": "RSS 0.91 (Netscape)",
+        "rss091u": "RSS 0.91 (Userland)",
+        "rss092": "RSS 0.92",
+        "rss093": "RSS 0.93",
+        "rss094": "RSS 0.94",
+        "rss20": "RSS 2.0",
+        "rss10": "RSS 1.0",
+        "rss": "RSS (unknown version)",
+        "atom01": "Atom 0.1",
+        "atom02": "Atom 0.2",
+        "atom03": "Atom 0.3",
+        "atom10": "Atom 1.0",
+        "atom": "Atom (unknown version)",
+        "cdf": "CDF",
+        "json1": "JSON feed 1",
+    }
+)
+
+# The class of the SAX parser returned by xml.sax.make_parser().
+_sax_parser_class: Optional[type[xml.sax.xmlreader.XMLReader]] = None
+_sax_parser_class_lock = threading.Lock()
+
+# Strings that start with these prefixes are fetched using HTTP(S).
+_URL_PREFIXES = ("http://", "https://")
+
+# The number of leading characters inspected by _looks_like_document().
+_DOCUMENT_SNIFF_LEN = 1024
 
 
 def _open_resource(
@@ -100,6 +120,11 @@ def _open_resource(
     # the returned file is guaranteed to be seekable.
     # (If the underlying resource is not seekable,
     # the content is read and wrapped in a io.BytesIO/StringIO.)
+    #
+    # Local files are returned as open files, not read() or mmap()'d:
+    # they're already seekable, and they're only ever read in chunks
+    # (except with optimistic_encoding_detection=False, where
+    # convert_to_utf8() needs the entire content as bytes anyway).
 
     if callable(getattr(url_file_stream_or_string, "read", None)):
         if callable(getattr(url_file_stream_or_string, "seekable", None)):
@@ -107,16 +132,19 @@ def _open_resource(
                 return url_file_stream_or_string
         return _to_in_memory_file(url_file_stream_or_string.read())
 
-    looks_like_url = isinstance(
-        url_file_stream_or_string, str
-    ) and urllib.parse.urlparse(url_file_stream_or_string)[0] in (
-        "http",
-        "https",
+    # Only look at the first few characters; the string may be an entire feed.
+    # Leading whitespace is ignored, as urllib.parse.urlparse() used to do.
+    looks_like_url = isinstance(url_file_stream_or_string, str) and (
+        url_file_stream_or_string[:64].lstrip()[:8].lower().startswith(_URL_PREFIXES)
     )
     if looks_like_url:
         data = http.get(url_file_stream_or_string, result)
         return io.BytesIO(data)
 
+    # Feed content passed as a string can't be a filename worth trying to open.
+    if _looks_like_document(url_file_stream_or_string):
+        return _to_in_memory_file(url_file_stream_or_string)
+
     # try to open with native open function (if url_file_stream_or_string is a filename)
     try:
         return open(url_file_stream_or_string, "rb")
@@ -134,6 +162,21 @@ def _open_resource(
     return _to_in_memory_file(url_file_stream_or_string)
 
 
+def _looks_like_document(data) -> bool:
+    """Return True if data is clearly markup or JSON rather than a filename.
+
+    Only the first few characters are inspected.
+    """
+
+    if isinstance(data, str):
+        text_head = data[:_DOCUMENT_SNIFF_LEN]
+        return "\n" in text_head or text_head.lstrip()[:1] in ("<", "{")
+    if isinstance(data, bytes):
+        byte_head = data[:_DOCUMENT_SNIFF_LEN]
+        return b"\n" in byte_head or byte_head.lstrip()[:1] in (b"<", b"{")
+    return False
+
+
 def _to_in_memory_file(data):
     if isinstance(data, str):
         return io.StringIO(data)
@@ -239,6 +282,29 @@ def parse(
     return result
 
 
+def parse_many(
+    sources: Iterable[Any],
+    max_workers: int = 8,
+    **kwargs: Any,
+) -> list[FeedParserDict]:
+    """Parse several feeds concurrently.
+
+    Each source is passed to :func:`parse`, along with any keyword arguments,
+    in a pool of up to ``max_workers`` threads.
+    The results are returned in the same order as ``sources``.
+
+    Threads mostly help when the sources are URLs, because downloads overlap.
+    Parsing itself is largely Python code that holds the GIL,
+    so parsing documents that are already in memory won't get much faster.
+
+    Date handlers registered with :func:`registerDateHandler`
+    are called from the worker threads, and must be thread-safe.
+    """
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        return list(executor.map(functools.partial(parse, **kwargs), sources))
+
+
 def _parse_file_inplace(
     file: Union[IO[bytes], IO[str]],
     result: dict,
@@ -257,8 +323,11 @@ def _parse_file_inplace(
     if optimistic_encoding_detection is None:
         optimistic_encoding_detection = bool(feedparser.OPTIMISTIC_ENCODING_DETECTION)
 
+    # result is a FeedParserDict, whose lookups go through its key aliases;
+    # look up the headers once.
+    headers = result["headers"]
     stream_factory = convert_file_to_utf8(
-        result["headers"], file, result, optimistic_encoding_detection
+        headers, file, result, optimistic_encoding_detection
     )
     # We're done with file, all access must happen through stream_factory.
     del file
@@ -278,20 +347,30 @@ def _parse_file_inplace(
         use_json_parser = True
     use_strict_parser = bool(result["encoding"])
 
-    result["version"], stream_factory.prefix, entities = replace_doctype(
-        stream_factory.prefix
-    )
+    entities: dict[str, str]
+    if use_json_parser:
+        # JSON feeds have no DOCTYPE or entities to extract.
+        result["version"], entities = None, {}
+    else:
+        result["version"], stream_factory.prefix, entities = replace_doctype(
+            stream_factory.prefix
+        )
 
     # Ensure that baseuri is an absolute URI using an acceptable URI scheme.
-    contentloc = result["headers"].get("content-location", "")
+    contentloc = headers.get("content-location", "")
     href = result.get("href", "")
-    baseuri = (
-        make_safe_absolute_uri(href, contentloc)
-        or make_safe_absolute_uri(contentloc)
-        or href
-    )
+    if not contentloc and href.startswith(_URL_PREFIXES):
+        # An absolute http(s) URL with nothing to resolve against it
+        # would be returned unchanged.
+        baseuri = href
+    else:
+        baseuri = (
+            make_safe_absolute_uri(href, contentloc)
+            or make_safe_absolute_uri(contentloc)
+            or href
+        )
 
-    baselang = result["headers"].get("content-language", None)
+    baselang = headers.get("content-language", None)
     if isinstance(baselang, bytes) and baselang is not None:
         baselang = baselang.decode("utf-8", "ignore")
 
@@ -305,7 +384,7 @@ def _parse_file_inplace(
         feed_parser = StrictFeedParser(baseuri, baselang, "utf-8")
         feed_parser.resolve_relative_uris = resolve_relative_uris
         feed_parser.sanitize_html = sanitize_html
-        saxparser = xml.sax.make_parser(PREFERRED_XML_PARSERS)
+        saxparser = _make_sax_parser()
         saxparser.setFeature(xml.sax.handler.feature_namespaces, 1)
         try:
             # Disable downloading external doctype references, if possible.
@@ -339,19 +418,10 @@ def _parse_file_inplace(
 
         # If an encoding was detected, use it; otherwise, assume utf-8 and do your best.
         # Will raise io.UnsupportedOperation if the underlying file is not seekable.
-        data = stream_factory.get_text_file("utf-8", "replace").read()
-
-        # As of 6.0.8, LooseFeedParser.feed() can be called exactly once
-        # with the entire data (it does some re.sub() and str.replace() on it).
         #
-        # SGMLParser (of which LooseFeedParser is a subclass)
-        # *can* be fed in a streaming fashion,
-        # by calling feed() repeatedly with chunks of text.
-        #
-        # When/if LooseFeedParser will support being fed chunks,
-        # replace the read() call above with read(size)/feed() calls in a loop.
-
-        feed_parser.feed(data)
+        # The text is decoded and fed to the parser in chunks,
+        # so the entire feed is never held in memory as a single string.
+        feed_parser.feed_file(stream_factory.get_text_file("utf-8", "replace"))
 
         # If parsing with the loose XML parser resulted in no information,
         # flag that the JSON parser should be tried.
@@ -374,3 +444,29 @@ def _parse_file_inplace(
         result["namespaces"] = {}
     else:
         result["namespaces"] = feed_parser.namespaces_in_use
+
+
+def _make_sax_parser() -> xml.sax.xmlreader.XMLReader:
+    """Create a SAX parser, preferring the drivers in PREFERRED_XML_PARSERS.
+
+    xml.sax.make_parser() tries to import each driver module every time
+    it's called, so the class of the first parser it returns is cached
+    and instantiated directly afterwards.
+    """
+
+    global _sax_parser_class
+    sax_parser_class = _sax_parser_class
+    if sax_parser_class is not None:
+        try:
+            return sax_parser_class()
+        except xml.sax.SAXReaderNotAvailable:
+            pass
+
+    # parse_many() may call this from several threads at once.
+    with _sax_parser_class_lock:
+        if _sax_parser_class is not None and _sax_parser_class is not sax_parser_class:
+            # Another thread already found a driver.
+            return _sax_parser_class()
+        saxparser = xml.sax.make_parser(PREFERRED_XML_PARSERS)
+        _sax_parser_class = type(saxparser)
+    return saxparser
@@ -63,9 +63,12 @@ UTF32LE_MARKER = b"\x3C\x00\x00\x00"
 
 ZERO_BYTES = b"\x00\x00"
 
+# Text decoded using these encodings is unchanged when it's encoded as UTF-8.
+UTF8_COMPATIBLE_ENCODINGS = {"utf-8", "ascii"}
+
 # Match the opening XML declaration.
 # Example: <?xml version="1.0" encoding="utf-8"?>
-RE_XML_DECLARATION = re.compile(r"^<\?xml[^>]*?>")
+RE_XML_DECLARATION = re.compile(rb"^<\?xml[^>]*?>")
 
 # Capture the value of the XML processing instruction's encoding attribute.
 # Example: <?xml version="1.0" encoding="utf-8"?>
@@ -150,31 +153,32 @@ def convert_to_utf8(
     # The heuristic follows the XML specification, section F:
     # http://www.w3.org/TR/REC-xml/#sec-guessing-no-ext-info
     # Check for BOMs first.
-    if data[:4] == codecs.BOM_UTF32_BE:
+    head = data[:4]
+    if head == codecs.BOM_UTF32_BE:
         bom_encoding = "utf-32be"
         data = data[4:]
-    elif data[:4] == codecs.BOM_UTF32_LE:
+    elif head == codecs.BOM_UTF32_LE:
         bom_encoding = "utf-32le"
         data = data[4:]
-    elif data[:2] == codecs.BOM_UTF16_BE and data[2:4] != ZERO_BYTES:
+    elif head[:2] == codecs.BOM_UTF16_BE and head[2:4] != ZERO_BYTES:
         bom_encoding = "utf-16be"
         data = data[2:]
-    elif data[:2] == codecs.BOM_UTF16_LE and data[2:4] != ZERO_BYTES:
+    elif head[:2] == codecs.BOM_UTF16_LE and head[2:4] != ZERO_BYTES:
         bom_encoding = "utf-16le"
         data = data[2:]
-    elif data[:3] == codecs.BOM_UTF8:
+    elif head[:3] == codecs.BOM_UTF8:
         bom_encoding = "utf-8"
         data = data[3:]
     # Check for the characters '<?xm' in several encodings.
-    elif data[:4] == EBCDIC_MARKER:
+    elif head == EBCDIC_MARKER:
         bom_encoding = "cp037"
-    elif data[:4] == UTF16BE_MARKER:
+    elif head == UTF16BE_MARKER:
         bom_encoding = "utf-16be"
-    elif data[:4] == UTF16LE_MARKER:
+    elif head == UTF16LE_MARKER:
         bom_encoding = "utf-16le"
-    elif data[:4] == UTF32BE_MARKER:
+    elif head == UTF32BE_MARKER:
         bom_encoding = "utf-32be"
-    elif data[:4] == UTF32LE_MARKER:
+    elif head == UTF32LE_MARKER:
         bom_encoding = "utf-32le"
 
     tempdata = data
@@ -210,6 +214,10 @@ def convert_to_utf8(
         ):
             xml_encoding = bom_encoding
 
+    # If there was a BOM, tempdata is a re-encoded copy of the entire document
+    # (and the match object refers to it). Release it before converting.
+    del tempdata, xml_encoding_match
+
     # Find the HTTP Content-Type and, hopefully, a character
     # encoding provided by the server. The Content-Type is used
     # to choose the "correct" encoding among the BOM encoding,
@@ -301,14 +309,18 @@ def convert_to_utf8(
             continue
 
         known_encoding = True
+        # If the data is already UTF-8, it was only decoded to validate it;
+        # skip the round trip back to bytes.
+        if codecs.lookup(proposed_encoding).name not in UTF8_COMPATIBLE_ENCODINGS:
+            data = text.encode("utf-8")
+        del text
         if not json:
             # Update the encoding in the opening XML processing instruction.
-            new_declaration = """<?xml version='1.0' encoding='utf-8'?>"""
-            if RE_XML_DECLARATION.search(text):
-                text = RE_XML_DECLARATION.sub(new_declaration, text)
+            new_declaration = b"""<?xml version='1.0' encoding='utf-8'?>"""
+            if RE_XML_DECLARATION.search(data):
+                data = RE_XML_DECLARATION.sub(new_declaration, data)
             else:
-                text = new_declaration + "\n" + text
-        data = text.encode("utf-8")
+                data = new_declaration + b"\n" + data
         break
 
     # if still no luck, give up
@@ -77,6 +77,8 @@ _cp1252 = {
 class BaseHTMLProcessor(sgmllib.SGMLParser):
     special = re.compile("""[<>'"]""")
     bare_ampersand = re.compile(r"&(?!#\d+;|#x[0-9a-fA-F]+;|\w+;)")
+    bogus_declaration = re.compile(r"<!(?!DOCTYPE|--|\[)", re.IGNORECASE)
+    shorttag_element = re.compile(r"<([^<>\s]+?)\s*/>")
     elements_no_end_tag = {
         "area",
         "base",
@@ -145,17 +147,86 @@ class BaseHTMLProcessor(sgmllib.SGMLParser):
                 self.unknown_endtag(self.lasttag)
         return j
 
-    def feed(self, data):
+    def _normalize_markup(self, data):
         """
         :type data: str
-        :rtype: None
+        :rtype: str
         """
 
-        data = re.sub(r"<!((?!DOCTYPE|--|\[))", r"&lt;!\1", data, flags=re.IGNORECASE)
-        data = re.sub(r"<([^<>\s]+?)\s*/>", self._shorttag_replace, data)
+        data = self.bogus_declaration.sub("&lt;!", data)
+        data = self.shorttag_element.sub(self._shorttag_replace, data)
         data = data.replace("&#39;", "'")
         data = data.replace("&#34;", '"')
-        super().feed(data)
+        return data
+
+    def feed(self, data):
+        """
+        :type data: str
+        :rtype: None
+        """
+
+        super().feed(self._normalize_markup(data))
+        super().close()
+
+    def feed_file(self, file, chunk_size=2**16):
+        """Feed the content of a text stream to the parser, one chunk at a time.
+
+        The content is normalized exactly as feed() would normalize it,
+        but it never has to be held in memory all at once.
+        The result is the same as calling feed() with the entire content,
+        except that a start tag with a "<" or ">" inside a quoted attribute
+        value may be parsed differently if it spans two chunks.
+
+        :type file: IO[str]
+        :type chunk_size: int
+        :rtype: None
+        """
+
+        pending = ""
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            data = pending + chunk
+
+            # The markup normalization regexes never match across a "<"
+            # that is still there after bogus declarations are escaped,
+            # so it's safe to split the content right before the last one.
+            # Near the end of the buffer, it may not be possible to tell yet
+            # whether a "<" starts a bogus declaration; if there's no "<"
+            # that is certain to remain, split before the first of those.
+            # Failing that, only keep back a possibly incomplete "&#39;".
+            split = data.rfind("<")
+            undecided = -1
+            while split != -1 and (
+                split == len(data) - 1 or self.bogus_declaration.match(data, split)
+            ):
+                if len(data) - split < len("<!DOCTYPE"):
+                    undecided = split
+                split = data.rfind("<", 0, split)
+            if split == -1:
+                split = undecided
+            if split == -1:
+                split = data.rfind("&", max(len(data) - 4, 0))
+            if split == -1:
+                split = len(data)
+
+            # An unterminated CDATA block is consumed up to the end of
+            # the buffer, so it must not be split either.
+            start = 0
+            while True:
+                cdata = data.find("<![CDATA[", start, split)
+                if cdata == -1:
+                    break
+                start = data.find("]]>", cdata, split)
+                if start == -1:
+                    split = cdata
+                    break
+
+            pending = data[split:]
+            super().feed(self._normalize_markup(data[:split]))
+
+        super().feed(self._normalize_markup(pending))
         super().close()
 
     @staticmethod
@@ -899,6 +899,13 @@ def sanitize_html(html_source, encoding, _type):
     return data
 
 
+# Match documents that begin with markup.
+RE_MARKUP_START_PATTERN = re.compile(rb"^\s*<")
+
+# Match the start of the first element.
+# Example: <feed
+RE_FIRST_ELEMENT_PATTERN = re.compile(rb"<\w")
+
 # Match XML entity declarations.
 # Example: <!ENTITY copyright "(C)">
 RE_ENTITY_PATTERN = re.compile(rb"^\s*<!ENTITY([^>]*?)>", re.MULTILINE)
@@ -933,12 +940,12 @@ def replace_doctype(data: bytes) -> tuple[str | None, bytes, dict[str, str]]:
     """
 
     # Verify this looks like an XML feed.
-    if not re.match(rb"^\s*<", data):
+    if not RE_MARKUP_START_PATTERN.match(data):
         return None, data, {}
 
     # Divide the document into two groups by finding the location
     # of the first element that doesn't begin with '<?' or '<!'.
-    match = re.search(rb"<\w", data)
+    match = RE_FIRST_ELEMENT_PATTERN.search(data)
     first_element = match.start() + 1 if match is not None else 0
     head, data = data[:first_element], data[first_element:]
 
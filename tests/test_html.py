@@ -0,0 +1,41 @@
+import io
+
+import pytest
+
+import feedparser.html
+
+html = (
+    "<p>one &amp; two &#39;three&#39;</p><br/>"
+    "<!DOCTYPE html><!-- a <comment> --><!bogus>"
+    "<![CDATA[<![CDATA[<b>bold</b>]]&gt;]]><a href='/x'>link</a>"
+)
+
+
+@pytest.mark.parametrize("chunk_size", (1, 2, 3, 5, 8, 13, 2**16))
+def test_feed_file_matches_feed(chunk_size):
+    expected = feedparser.html.BaseHTMLProcessor()
+    expected.feed(html)
+
+    parser = feedparser.html.BaseHTMLProcessor()
+    parser.feed_file(io.StringIO(html), chunk_size)
+
+    assert parser.output() == expected.output()
+
+
+@pytest.mark.parametrize(
+    "text, chunk_size",
+    (
+        # Escaping the bogus declaration lets the short tag regex match
+        # across the "<" that the chunk boundary falls right before.
+        ("a" * (2**16 - 7) + "<div<!x/>tail", 2**16),
+        *(("<div<!x/>tail<!DOCTYPE x><!x>", size) for size in range(1, 12)),
+    ),
+)
+def test_feed_file_bogus_declaration_at_chunk_boundary(text, chunk_size):
+    expected = feedparser.html.BaseHTMLProcessor()
+    expected.feed(text)
+
+    parser = feedparser.html.BaseHTMLProcessor()
+    parser.feed_file(io.StringIO(text), chunk_size)
+
+    assert parser.output() == expected.output()
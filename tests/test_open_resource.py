@@ -1,5 +1,7 @@
 import io
 
+import responses
+
 import feedparser
 
 
@@ -30,3 +32,33 @@ def test_unicode_2():
     s = rb"<feed><item><title>t\u00e9xt</title></item></feed>"
     r = feedparser.api._open_resource(s, {}).read()
     assert s == r
+
+
+def test_url_scheme_is_case_insensitive():
+    url = "HTTP://example.com/uppercase-scheme.xml"
+    responses.get(url.lower(), body=b"<feed></feed>")
+    r = feedparser.api._open_resource(url, {}).read()
+    assert r == b"<feed></feed>"
+
+    # Leading whitespace is ignored.
+    url = " \thttp://example.com/leading-whitespace.xml"
+    responses.get(url.lstrip(), body=b"<feed></feed>")
+    r = feedparser.api._open_resource(url, {}).read()
+    assert r == b"<feed></feed>"
+
+
+def test_document_string_is_not_opened(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("open() should not be called")
+
+    monkeypatch.setattr(feedparser.api, "open", fail, raising=False)
+    for s in ("  <feed></feed>", b'{"version": ""}', "feed\ntext"):
+        r = feedparser.api._open_resource(s, {}).read()
+        assert s == r
+
+
+def test_filename_is_opened(tmp_path):
+    path = tmp_path / "feed.xml"
+    path.write_bytes(b"<feed></feed>")
+    with feedparser.api._open_resource(str(path), {}) as file:
+        assert file.read() == b"<feed></feed>"
@@ -114,3 +114,12 @@ def test_optimistic_encoding_detection(get_content, kwargs):
     result = feedparser.parse(content, **kwargs)
     assert len(result.entries), result
     assert result.entries[0].description == description
+
+
+def test_parse_many():
+    sources = [
+        io.BytesIO(b'<rss version="2.0"><channel><title>%d</title></channel></rss>' % i)
+        for i in range(20)
+    ]
+    results = feedparser.parse_many(sources, max_workers=4, sanitize_html=False)
+    assert [result.feed.title for result in results] == [str(i) for i in range(20)]